@@ -2146,14 +2146,16 @@ class WorkflowConfig:
             taskd.clocktrigger_offset = self.clock_offsets[name]
         if name in self.expiration_offsets:
             taskd.expiration_offset = self.expiration_offsets[name]
+        if rtcfg['events']['late offset']:
+            taskd.late_offset_seconds = float(rtcfg['events']['late offset'])
         if name in self.ext_triggers:
             taskd.external_triggers.append(self.ext_triggers[name])
 
         taskd.sequential = (
             name in self.cfg['scheduling']['special tasks']['sequential'])
 
-        taskd.namespace_hierarchy = list(
-            reversed(self.runtime['linearized ancestors'][name]))
+        taskd.namespace_hierarchy = reversed(
+            self.runtime['linearized ancestors'][name])
 
         if name in self.task_param_vars:
             taskd.param_var.update(self.task_param_vars[name])
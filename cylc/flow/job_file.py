@@ -34,6 +34,11 @@ class JobFileWriter:
 
     """Write task job files."""
 
+    # ~foo/bar or ~/bar
+    TILDE_PATH_REC = re.compile(r"^(~[^/\s]*/)(.*)$")
+    # plain ~foo or just ~
+    TILDE_ONLY_REC = re.compile(r"^~[^\s]*$")
+
     def __init__(self):
         self.workflow_env = {}
         self.job_runner_mgr = JobRunnerManager()
@@ -280,24 +285,24 @@ class JobFileWriter:
                 # ParamExpandError: Already logged warnings in
                 # cylc.flow.config.WorkflowConfig.check_param_env_tmpls()
 
-        # Handle '~':
-        match = re.match(r"^(~[^/\s]*/)(.*)$", value)
-        if match:
-            # ~foo/bar or ~/bar
-            # write as ~foo/"bar" or ~/"bar"
-            head, tail = match.groups()
-            return '%s"%s"' % (head, tail)
-        elif re.match(r"^~[^\s]*$", value):
-            # plain ~foo or just ~
-            # just leave unquoted as subsequent spaces don't
-            # make sense in this case anyway
-            return value
-        else:
-            # Non tilde values - quote the lot.
-            # This gets values like "~one ~two" too, but these
-            # (in variable values) aren't expanded by the shell
-            # anyway so it doesn't matter.
-            return '"%s"' % value
+        # Handle '~' (most values don't start with one, skip the regexes):
+        if value.startswith('~'):
+            match = JobFileWriter.TILDE_PATH_REC.match(value)
+            if match:
+                # ~foo/bar or ~/bar
+                # write as ~foo/"bar" or ~/"bar"
+                head, tail = match.groups()
+                return '%s"%s"' % (head, tail)
+            elif JobFileWriter.TILDE_ONLY_REC.match(value):
+                # plain ~foo or just ~
+                # just leave unquoted as subsequent spaces don't
+                # make sense in this case anyway
+                return value
+        # Non tilde values - quote the lot.
+        # This gets values like "~one ~two" too, but these
+        # (in variable values) aren't expanded by the shell
+        # anyway so it doesn't matter.
+        return '"%s"' % value
 
         # NOTE ON TILDE EXPANSION:
         # The code above handles the following correctly:
@@ -88,7 +88,8 @@ class Prerequisite:
             pre_initial (bool): this is a pre-initial dependency.
 
         """
-        message = (name, str(point), output)
+        point_str = str(point)
+        message = (name, point_str, output)
 
         # Add a new prerequisite as satisfied if pre-initial, else unsatisfied.
         if pre_initial:
@@ -97,8 +98,8 @@ class Prerequisite:
             self.satisfied[message] = self.DEP_STATE_UNSATISFIED
         if self._all_satisfied is not None:
             self._all_satisfied = False
-        if point and str(point) not in self.target_point_strings:
-            self.target_point_strings.append(str(point))
+        if point and point_str not in self.target_point_strings:
+            self.target_point_strings.append(point_str)
 
     def get_raw_conditional_expression(self):
         """Return a representation of this prereq as a string.
@@ -137,12 +138,22 @@ class Prerequisite:
         self._all_satisfied = None
         if '|' in expr:
             # Make a Python expression so we can eval() the logic.
-            for message in self.satisfied:
+            replacements = {
+                self.MESSAGE_TEMPLATE % message:
+                    self.SATISFIED_TEMPLATE % message
+                for message in self.satisfied
+            }
+            if replacements:
+                # Substitute all messages in a single pass.
                 # Use '\b' in case one task name is a substring of another
                 # and escape special chars ('.', timezone '+') in task IDs.
                 expr = re.sub(
-                    fr"\b{re.escape(self.MESSAGE_TEMPLATE % message)}\b",
-                    self.SATISFIED_TEMPLATE % message,
+                    '|'.join(
+                        fr"\b{re.escape(message)}\b"
+                        for message in sorted(
+                            replacements, key=len, reverse=True)
+                    ),
+                    lambda match: replacements[match.group()],
                     expr
                 )
             self.conditional_expression = expr
@@ -1470,7 +1470,7 @@ class Scheduler:
                     if self.xtrigger_mgr.check_xtriggers(
                             itask, self.workflow_db_mgr.put_xtriggers):
                         housekeep_xtriggers = True
-                        if all(itask.is_ready_to_run()):
+                        if itask.is_ready():
                             self.pool.queue_task(itask)
 
                 # Check for satisfied ext_triggers, and queue if ready.
@@ -1479,7 +1479,7 @@ class Scheduler:
                     and not itask.state.external_triggers_all_satisfied()
                     and self.broadcast_mgr.check_ext_triggers(
                         itask, self.ext_trigger_queue)
-                    and all(itask.is_ready_to_run())
+                    and itask.is_ready()
                 ):
                     self.pool.queue_task(itask)
 
@@ -178,7 +178,7 @@ class TaskEventsManager():
     FLAG_POLLED = "(polled)"
     FLAG_POLLED_IGNORED = "(polled-ignored)"
     KEY_EXECUTE_TIME_LIMIT = 'execution_time_limit'
-    NON_UNIQUE_EVENTS = ('warning', 'critical', 'custom')
+    NON_UNIQUE_EVENTS = frozenset(['warning', 'critical', 'custom'])
 
     def __init__(
         self, workflow, proc_pool, workflow_db_mgr, broadcast_mgr,
@@ -536,7 +536,7 @@ class TaskEventsManager():
                 itask, ("message %s" % str(severity).lower()), message)
         lseverity = str(severity).lower()
         if lseverity in self.NON_UNIQUE_EVENTS:
-            itask.non_unique_events.update({lseverity: 1})
+            itask.bump_non_unique_event(lseverity)
             self.setup_event_handlers(itask, lseverity, message)
 
     def _process_message_check(
@@ -998,7 +998,8 @@ class TaskEventsManager():
         if itask.tdef.run_mode == 'simulation':
             # Simulate job execution at this point.
             itask.set_summary_time('submitted', event_time)
-            itask.set_summary_time('started', event_time)
+            itask.set_summary_time(
+                'started', event_time, epoch=itask.summary['submitted_time'])
             if itask.state.reset(TASK_STATUS_RUNNING):
                 self.data_store_mgr.delta_task_state(itask)
             itask.state.outputs.set_completion(TASK_OUTPUT_STARTED, True)
@@ -1064,7 +1065,8 @@ class TaskEventsManager():
         if event in self.NON_UNIQUE_EVENTS:
             key1 = (
                 self.HANDLER_MAIL,
-                '%s-%d' % (event, itask.non_unique_events[event] or 1)
+                '%s-%d' % (
+                    event, itask.get_non_unique_event_count(event) or 1)
             )
         else:
             key1 = (self.HANDLER_MAIL, event)
@@ -1108,7 +1110,8 @@ class TaskEventsManager():
             if event in self.NON_UNIQUE_EVENTS:
                 key1 = (
                     f'{self.HANDLER_CUSTOM}-{i:02d}',
-                    f'{event}-{itask.non_unique_events[event] or 1:d}'
+                    f'{event}-'
+                    f'{itask.get_non_unique_event_count(event) or 1:d}'
                 )
             else:
                 key1 = (f'{self.HANDLER_CUSTOM}-{i:02d}', event)
@@ -1171,7 +1171,7 @@ class TaskJobManager:
             # Job pool insertion
             job_config = deepcopy(job_conf)
             job_config['logfiles'] = deepcopy(itask.summary['logfiles'])
-            itask.jobs.append(job_config['job_d'])
+            itask.append_job(job_config['job_d'])
             self.data_store_mgr.insert_job(
                 itask.tdef.name, itask.point, job_config)
 
@@ -504,8 +504,9 @@ class TaskPool:
                 sat[key] = satisfied if satisfied != '0' else False
 
             for itask_prereq in itask.state.prerequisites:
-                for key, _ in itask_prereq.satisfied.items():
-                    itask_prereq.satisfied[key] = sat[key]
+                satisfied = itask_prereq.satisfied
+                satisfied.update({key: sat[key] for key in satisfied})
+            itask.state.invalidate_prerequisites_cache()
 
             itask.state.reset(status)
             itask.state.reset(is_runahead=True)
@@ -610,7 +611,7 @@ class TaskPool:
         LOG.info("[%s] -released from runahead", itask)
 
         # Queue if ready to run
-        if all(itask.is_ready_to_run()):
+        if itask.is_ready():
             # (otherwise waiting on xtriggers etc.)
             self.queue_task(itask)
 
@@ -1062,7 +1063,7 @@ class TaskPool:
     def release_held_active_task(self, itask: TaskProxy) -> None:
         if itask.state.reset(is_held=False):
             self.data_store_mgr.delta_task_held(itask)
-            if (not itask.state.is_runahead) and all(itask.is_ready_to_run()):
+            if (not itask.state.is_runahead) and itask.is_ready():
                 self.queue_task(itask)
         self.tasks_to_hold.discard((itask.tdef.name, itask.point))
         self.workflow_db_mgr.put_tasks_to_hold(self.tasks_to_hold)
@@ -1583,7 +1584,7 @@ class TaskPool:
         if itask.expire_time is None:
             itask.expire_time = (
                 itask.get_point_as_seconds() +
-                itask.get_offset_as_seconds(itask.tdef.expiration_offset))
+                itask.tdef.expiration_offset_seconds)
         if time() > itask.expire_time:
             msg = 'Task expired (skipping job).'
             LOG.warning('[%s] -%s', itask, msg)
@@ -1626,16 +1627,13 @@ class TaskPool:
         if not items:
             itasks = self.get_all_tasks()
         else:
+            all_tasks = self.get_all_tasks()
             for item in items:
                 point_str, name_str, status = self._parse_task_item(item)
-                tasks_found = False
-                for itask in self.get_all_tasks():
-                    if (itask.point_match(point_str) and
-                            itask.name_match(name_str) and
-                            itask.status_match(status)):
-                        itasks.append(itask)
-                        tasks_found = True
-                if not tasks_found:
+                matches = TaskProxy.filter_proxies(
+                    all_tasks, name_str, point_str, status)
+                itasks.extend(matches)
+                if not matches:
                     if warn:
                         LOG.warning(f"No active tasks matching: {item}")
                     bad_items.append(item)
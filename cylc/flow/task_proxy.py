@@ -19,8 +19,11 @@
 from collections import Counter
 from contextlib import suppress
 from fnmatch import fnmatchcase
+from functools import partial
+import re
 from time import time
-from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
+from typing import (
+    Any, Callable, Dict, Iterable, List, Tuple, Optional, TYPE_CHECKING)
 
 from metomi.isodatetime.timezone import get_local_time_zone
 
@@ -31,13 +34,15 @@ from cylc.flow.platforms import get_platform
 from cylc.flow.task_id import TaskID
 from cylc.flow.task_action_timer import TimerFlags
 from cylc.flow.task_state import TaskState, TASK_STATUS_WAITING
-from cylc.flow.taskdef import generate_graph_children
+from cylc.flow.taskdef import TaskDef
 from cylc.flow.wallclock import get_unix_time_from_time_string as str2time
 
 if TYPE_CHECKING:
     from cylc.flow.cycling import PointBase
     from cylc.flow.task_action_timer import TaskActionTimer
-    from cylc.flow.taskdef import TaskDef
+
+
+_GLOB_CHARS = re.compile(r'[*?[]')
 
 
 class TaskProxy:
@@ -46,6 +51,8 @@ class TaskProxy:
     Attributes:
         .clock_trigger_time:
             Clock trigger time in seconds since epoch.
+        .is_clock_trigger_done:
+            Has the clock trigger time passed?
         .expire_time:
             Time in seconds since epoch when this task is considered expired.
         .identity:
@@ -58,6 +65,7 @@ class TaskProxy:
             Is the latest job pre-empted (or vacated)?
         .jobs:
             A list of job ids associated with the task proxy.
+            None until the first job is added.
         .local_job_file_path:
             Path on workflow host to the latest job script for the task.
         .late_time:
@@ -65,6 +73,7 @@ class TaskProxy:
             late if it is never active.
         .non_unique_events (collections.Counter):
             Count non-unique events (e.g. critical, warning, custom).
+            None until the first non-unique event is recorded.
         .point:
             Cycle point of the task.
         .point_as_seconds:
@@ -79,6 +88,7 @@ class TaskProxy:
         .submit_num:
             Number of times the task has attempted job submission.
         .summary (dict):
+            Created on first access.
             job_runner_name (str):
                 Name of job runner where latest job is submitted.
             description (str):
@@ -123,8 +133,9 @@ class TaskProxy:
         .try_timers:
             Retry schedules as cylc.flow.task_action_timer.TaskActionTimer
             objects.
-        .graph_children (dict)
+        .graph_children (mapping)
             graph children: {msg: [(name, point), ...]}
+            (read-only, shared by proxies of the same task and point)
         .flow_label:
             flow label
         .reflow:
@@ -147,6 +158,7 @@ class TaskProxy:
     # Memory optimization - constrain possible attributes to this list.
     __slots__ = [
         'clock_trigger_time',
+        'is_clock_trigger_done',
         'expire_time',
         'identity',
         'is_late',
@@ -157,13 +169,14 @@ class TaskProxy:
         'local_job_file_path',
         'non_unique_events',
         'point',
+        '_point_str',
         'point_as_seconds',
         'poll_timer',
         'reload_successor',
         'submit_num',
         'tdef',
         'state',
-        'summary',
+        '_summary',
         'platform',
         'timeout',
         'try_timers',
@@ -180,39 +193,26 @@ class TaskProxy:
         flow_label: Optional[str],
         status: str = TASK_STATUS_WAITING,
         is_held: bool = False,
-        submit_num: int = 0,
+        submit_num: Optional[int] = 0,
         is_late: bool = False,
         reflow: bool = True
     ) -> None:
 
         self.tdef = tdef
-        if submit_num is None:
-            submit_num = 0
-        self.submit_num = submit_num
-        self.jobs: List[str] = []
+        self.submit_num = submit_num or 0
+        self.jobs: Optional[List[str]] = None
         self.flow_label = flow_label
         self.reflow = reflow
         self.point = start_point
-        self.identity: str = TaskID.get(self.tdef.name, self.point)
+        self._point_str: str = str(self.point)
+        self.identity: str = (
+            f'{self.tdef.name}{TaskID.DELIM}{self._point_str}')
 
         self.reload_successor: Optional['TaskProxy'] = None
         self.point_as_seconds: Optional[int] = None
 
         self.is_manual_submit = False
-        self.summary: Dict[str, Any] = {
-            'submitted_time': None,
-            'submitted_time_string': None,
-            'started_time': None,
-            'started_time_string': None,
-            'finished_time': None,
-            'finished_time_string': None,
-            'logfiles': [],
-            'platforms_used': {},
-            'execution_time_limit': None,
-            'job_runner_name': None,
-            'submit_method_id': None,
-            'flow_label': None
-        }
+        self._summary: Optional[Dict[str, Any]] = None
 
         self.local_job_file_path: Optional[str] = None
 
@@ -222,9 +222,10 @@ class TaskProxy:
         self.poll_timer: Optional['TaskActionTimer'] = None
         self.timeout: Optional[float] = None
         self.try_timers: Dict[str, 'TaskActionTimer'] = {}
-        self.non_unique_events = Counter()  # type: ignore # TODO: figure out
+        self.non_unique_events: Optional[Counter] = None
 
         self.clock_trigger_time: Optional[float] = None
+        self.is_clock_trigger_done = False
         self.expire_time: Optional[float] = None
         self.late_time: Optional[float] = None
         self.is_late = is_late
@@ -233,7 +234,35 @@ class TaskProxy:
         self.state = TaskState(tdef, self.point, status, is_held)
 
         # Determine graph children of this task (for spawning).
-        self.graph_children = generate_graph_children(tdef, self.point)
+        self.graph_children = tdef.get_graph_children(self.point)
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Return the job summary, creating it on first access.
+
+        Most tasks never submit a job, so the dict is not allocated until
+        something needs to read or write it.
+        """
+        if self._summary is None:
+            self._summary = {
+                'submitted_time': None,
+                'submitted_time_string': None,
+                'started_time': None,
+                'started_time_string': None,
+                'finished_time': None,
+                'finished_time_string': None,
+                'logfiles': [],
+                'platforms_used': {},
+                'execution_time_limit': None,
+                'job_runner_name': None,
+                'submit_method_id': None,
+                'flow_label': None
+            }
+        return self._summary
+
+    @summary.setter
+    def summary(self, summary: Dict[str, Any]) -> None:
+        self._summary = summary
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} '{self.identity}'>"
@@ -259,20 +288,19 @@ class TaskProxy:
         reload_successor.state.is_runahead = self.state.is_runahead
         reload_successor.state.is_updated = self.state.is_updated
         reload_successor.state.prerequisites = self.state.prerequisites
+        reload_successor.state.invalidate_prerequisites_cache()
 
     @staticmethod
     def get_offset_as_seconds(offset):
         """Return an ISO interval as seconds."""
-        iso_offset = cylc.flow.cycling.iso8601.interval_parse(str(offset))
-        return int(iso_offset.get_seconds())
+        return TaskDef.get_offset_as_seconds(offset)
 
     def get_late_time(self):
         """Compute and store late time as seconds since epoch."""
         if self.late_time is None:
-            if self.tdef.rtconfig['events']['late offset']:
-                self.late_time = (
-                    self.get_point_as_seconds() +
-                    self.tdef.rtconfig['events']['late offset'])
+            late_offset = self.tdef.late_offset_seconds
+            if late_offset is not None:
+                self.late_time = self.get_point_as_seconds() + late_offset
             else:
                 # Not used, but allow skip of the above "is None" test
                 self.late_time = 0
@@ -282,7 +310,7 @@ class TaskProxy:
         """Compute and store my cycle point as seconds since epoch."""
         if self.point_as_seconds is None:
             iso_timepoint = cylc.flow.cycling.iso8601.point_parse(
-                str(self.point))
+                self._point_str)
             self.point_as_seconds = int(iso_timepoint.get(
                 'seconds_since_unix_epoch'))
             if iso_timepoint.time_zone.unknown:
@@ -293,6 +321,25 @@ class TaskProxy:
                 self.point_as_seconds += utc_offset_in_seconds
         return self.point_as_seconds
 
+    def append_job(self, job_id: str) -> None:
+        """Record a job id against this task proxy."""
+        if self.jobs is None:
+            self.jobs = [job_id]
+        else:
+            self.jobs.append(job_id)
+
+    def bump_non_unique_event(self, event: str) -> None:
+        """Increment the count of a non-unique event (e.g. warning)."""
+        if self.non_unique_events is None:
+            self.non_unique_events = Counter()
+        self.non_unique_events[event] += 1
+
+    def get_non_unique_event_count(self, event: str) -> int:
+        """Return the number of times a non-unique event has occurred."""
+        if self.non_unique_events is None:
+            return 0
+        return self.non_unique_events[event]
+
     def get_try_num(self):
         """Return the number of automatic tries (try number)."""
         try:
@@ -303,14 +350,11 @@ class TaskProxy:
     def next_point(self):
         """Return the next cycle point."""
         p_next = None
-        adjusted = []
         for seq in self.tdef.sequences:
             nxt = seq.get_next_point(self.point)
-            if nxt:
-                # may be None if beyond the sequence bounds
-                adjusted.append(nxt)
-        if adjusted:
-            p_next = min(adjusted)
+            # may be None if beyond the sequence bounds
+            if nxt and (p_next is None or nxt < p_next):
+                p_next = nxt
         return p_next
 
     def is_ready_to_run(self) -> Tuple[bool, ...]:
@@ -323,53 +367,84 @@ class TaskProxy:
         if self.is_manual_submit:
             # Manually triggered, ignore unsatisfied prerequisites.
             return (True,)
-        if self.state.is_held:
+        state = self.state
+        if state.is_held:
             # A held task is not ready to run.
             return (False,)
-        if self.state.status in self.try_timers:
+        if state.status in self.try_timers:
             # A try timer is still active.
-            return (self.try_timers[self.state.status].is_delay_done(),)
+            return (self.try_timers[state.status].is_delay_done(),)
         return (
-            self.state(TASK_STATUS_WAITING),
+            state(TASK_STATUS_WAITING),
             self.is_waiting_clock_done(),
             self.is_waiting_prereqs_done()
         )
 
-    def set_summary_time(self, event_key, time_str=None):
+    def is_ready(self) -> bool:
+        """Is this task ready to run?
+
+        Equivalent to ``all(self.is_ready_to_run())`` but stops at the first
+        unsatisfied check, and does not build the tuple. Keep the checks in
+        step with is_ready_to_run.
+
+        """
+        if self.is_manual_submit:
+            return True
+        state = self.state
+        if state.is_held:
+            return False
+        if state.status in self.try_timers:
+            return self.try_timers[state.status].is_delay_done()
+        return (
+            state(TASK_STATUS_WAITING)
+            and self.is_waiting_clock_done()
+            and self.is_waiting_prereqs_done()
+        )
+
+    def set_summary_time(self, event_key, time_str=None, *, epoch=None):
         """Set an event time in self.summary
 
         Set values of both event_key + "_time" and event_key + "_time_string".
+        If the time is already known in seconds since epoch, pass it as
+        "epoch" to avoid parsing "time_str" again. "epoch" only applies when
+        "time_str" is given; otherwise both values are unset.
         """
+        summary = self.summary
         if time_str is None:
-            self.summary[event_key + '_time'] = None
+            summary[event_key + '_time'] = None
+        elif epoch is not None:
+            summary[event_key + '_time'] = float(epoch)
         else:
-            self.summary[event_key + '_time'] = float(str2time(time_str))
-        self.summary[event_key + '_time_string'] = time_str
+            summary[event_key + '_time'] = float(str2time(time_str))
+        summary[event_key + '_time_string'] = time_str
 
     def is_waiting_clock_done(self):
         """Is this task done waiting for its clock trigger time?
 
         Return True if there is no clock trigger or when clock trigger is done.
         """
-        if self.tdef.clocktrigger_offset is None:
+        if self.tdef.clocktrigger_offset is None or self.is_clock_trigger_done:
             return True
         if self.clock_trigger_time is None:
             self.clock_trigger_time = (
                 self.get_point_as_seconds() +
-                self.get_offset_as_seconds(self.tdef.clocktrigger_offset))
-        return time() >= self.clock_trigger_time
+                self.tdef.clocktrigger_offset_seconds)
+        # Once the trigger time has passed it stays passed.
+        self.is_clock_trigger_done = time() >= self.clock_trigger_time
+        return self.is_clock_trigger_done
 
     def is_task_prereqs_not_done(self):
         """Are some task prerequisites not satisfied?"""
-        return (not all(pre.is_satisfied()
-                for pre in self.state.prerequisites))
+        return not self.state.prerequisites_all_satisfied()
 
     def is_waiting_prereqs_done(self):
         """Are ALL prerequisites satisfied?"""
+        state = self.state
+        # Cheapest and most commonly unsatisfied checks first.
         return (
-            all(pre.is_satisfied() for pre in self.state.prerequisites)
-            and all(tri for tri in self.state.external_triggers.values())
-            and self.state.xtriggers_all_satisfied()
+            state.xtriggers_all_satisfied()
+            and state.external_triggers_all_satisfied()
+            and state.prerequisites_all_satisfied()
         )
 
     def reset_try_timers(self):
@@ -386,7 +461,9 @@ class TaskProxy:
             return True
         with suppress(PointParsingError):  # point_str may be a glob
             point = standardise_point_string(point)
-        return fnmatchcase(str(self.point), point)
+        if not _GLOB_CHARS.search(point):
+            return self._point_str == point
+        return fnmatchcase(self._point_str, point)
 
     def status_match(self, status: Optional[str]) -> bool:
         """Return whether a string matches the task's status.
@@ -397,8 +474,44 @@ class TaskProxy:
 
     def name_match(self, name: str) -> bool:
         """Return whether a string/glob matches the task's name."""
+        if not _GLOB_CHARS.search(name):
+            return (
+                name == self.tdef.name
+                or name in self.tdef.namespace_hierarchy_set
+            )
         if fnmatchcase(self.tdef.name, name):
             return True
         return any(
             fnmatchcase(ns, name) for ns in self.tdef.namespace_hierarchy
         )
+
+    @staticmethod
+    def filter_proxies(
+        itasks: Iterable['TaskProxy'],
+        name: str,
+        point: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List['TaskProxy']:
+        """Return the task proxies that match a name, point and status.
+
+        Equivalent to filtering with name_match, point_match and
+        status_match, but the point glob is standardised once for the whole
+        batch rather than once per task.
+        """
+        point_match: Optional[Callable[[str], Any]] = None
+        if point is not None:
+            with suppress(PointParsingError):  # point may be a glob
+                point = standardise_point_string(point)
+            if not _GLOB_CHARS.search(point):
+                point_match = point.__eq__
+            else:
+                point_match = partial(fnmatchcase, pat=point)
+        return [
+            itask
+            for itask in itasks
+            if (
+                (point_match is None or point_match(itask._point_str))
+                and ((not status) or itask.state.status == status)
+                and itask.name_match(name)
+            )
+        ]
@@ -41,11 +41,17 @@ class LimitedTaskQueue:
     def release(self, active: Counter[str]) -> List[TaskProxy]:
         """Release tasks if below the active limit."""
         # The "active" argument counts active tasks by name.
-        released: List[TaskProxy] = []
+        if not self.limit:
+            # Unlimited: release the whole queue in one go.
+            released: List[TaskProxy] = list(reversed(self.deque))
+            self.deque.clear()
+            active.update(itask.tdef.name for itask in released)
+            return released
+        released = []
         n_active: int = 0
         for mem in self.members:
             n_active += active[mem]
-        while not self.limit or n_active < self.limit:
+        while n_active < self.limit:
             try:
                 itask = self.deque.pop()
             except IndexError:
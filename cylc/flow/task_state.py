@@ -78,6 +78,11 @@ TASK_STATUSES_ORDERED = [
     TASK_STATUS_SUCCEEDED
 ]
 
+# Position of each status in TASK_STATUSES_ORDERED, for comparisons.
+_TASK_STATUS_INDEX = {
+    status: index for index, status in enumerate(TASK_STATUSES_ORDERED)
+}
+
 # Task statuses ordered according to display importance
 TASK_STATUS_DISPLAY_ORDER = [
     TASK_STATUS_SUBMIT_FAILED,
@@ -157,14 +162,12 @@ TASK_STATUSES_TRIGGERABLE = {
 
 def status_leq(status_a, status_b):
     """"Return True if status_a <= status_b"""
-    return (TASK_STATUSES_ORDERED.index(status_a) <=
-            TASK_STATUSES_ORDERED.index(status_b))
+    return _TASK_STATUS_INDEX[status_a] <= _TASK_STATUS_INDEX[status_b]
 
 
 def status_geq(status_a, status_b):
     """"Return True if status_a >= status_b"""
-    return (TASK_STATUSES_ORDERED.index(status_a) >=
-            TASK_STATUSES_ORDERED.index(status_b))
+    return _TASK_STATUS_INDEX[status_a] >= _TASK_STATUS_INDEX[status_b]
 
 
 class TaskState:
@@ -313,12 +316,21 @@ class TaskState:
         )
 
     def satisfy_me(self, all_task_outputs):
-        """Attempt to get my prerequisites satisfied."""
-        for prereqs in [self.prerequisites, self.suicide_prerequisites]:
-            for prereq in prereqs:
-                if prereq.satisfy_me(all_task_outputs):
-                    self._is_satisfied = None
-                    self._suicide_is_satisfied = None
+        """Attempt to get my prerequisites satisfied.
+
+        Satisfying outputs can only ever satisfy more of a prerequisite, so
+        a cached "all satisfied" state remains valid; only a cached
+        unsatisfied state for the affected list needs to be cleared.
+        """
+        for prereq in self.prerequisites:
+            if prereq.satisfy_me(all_task_outputs) and not self._is_satisfied:
+                self._is_satisfied = None
+        for prereq in self.suicide_prerequisites:
+            if (
+                prereq.satisfy_me(all_task_outputs)
+                and not self._suicide_is_satisfied
+            ):
+                self._suicide_is_satisfied = None
 
     def xtriggers_all_satisfied(self):
         """Return True if all xtriggers are satisfied."""
@@ -347,6 +359,15 @@ class TaskState:
                 preq.is_satisfied() for preq in self.suicide_prerequisites)
         return self._suicide_is_satisfied
 
+    def invalidate_prerequisites_cache(self):
+        """Clear cached satisfaction state after prerequisites are modified.
+
+        Call this after altering prerequisites other than via the methods of
+        this class (e.g. on restart or reload).
+        """
+        self._is_satisfied = None
+        self._suicide_is_satisfied = None
+
     def prerequisites_get_target_points(self):
         """Return a list of cycle points targeted by each prerequisite."""
         return {
@@ -465,8 +486,7 @@ class TaskState:
 
     def is_gt(self, status):
         """"Return True if self.status > status."""
-        return (TASK_STATUSES_ORDERED.index(self.status) >
-                TASK_STATUSES_ORDERED.index(status))
+        return _TASK_STATUS_INDEX[self.status] > _TASK_STATUS_INDEX[status]
 
     def _add_prerequisites(self, point, tdef):
         """Add task prerequisites."""
@@ -475,26 +495,27 @@ class TaskState:
         self._is_satisfied = None
         self._suicide_is_satisfied = None
 
+        add_prereq = self.prerequisites.append
+        add_suicide_prereq = self.suicide_prerequisites.append
         for sequence, dependencies in tdef.dependencies.items():
             if not sequence.is_valid(point):
                 continue
             for dependency in dependencies:
                 cpre = dependency.get_prerequisite(point, tdef)
                 if dependency.suicide:
-                    self.suicide_prerequisites.append(cpre)
+                    add_suicide_prereq(cpre)
                 else:
-                    self.prerequisites.append(cpre)
+                    add_prereq(cpre)
 
         if tdef.sequential:
             # Add a previous-instance succeeded prerequisite.
-            adjusted = []
+            p_prev = None
             for seq in tdef.sequences:
                 prv = seq.get_nearest_prev_point(point)
-                if prv:
+                if prv and (p_prev is None or prv > p_prev):
                     # None if out of sequence bounds.
-                    adjusted.append(prv)
-            if adjusted:
-                p_prev = max(adjusted)
+                    p_prev = prv
+            if p_prev is not None:
                 cpre = Prerequisite(point, tdef.start_point)
                 cpre.add(tdef.name, p_prev, TASK_STATUS_SUCCEEDED,
                          p_prev < tdef.start_point)
@@ -177,12 +177,14 @@ class Dependency:
 
     """
 
-    __slots__ = ['_exp', 'task_triggers', 'suicide']
+    __slots__ = ['_exp', 'task_triggers', 'suicide', '_is_conditional']
 
     def __init__(self, exp, task_triggers, suicide):
         self._exp = exp
         self.task_triggers = tuple(task_triggers)  # More memory efficient.
         self.suicide = suicide
+        # Only expressions containing '|' need a conditional expression.
+        self._is_conditional = self._contains_or(exp)
 
     def get_prerequisite(self, point, tdef):
         """Generate a Prerequisite object from this dependency.
@@ -198,7 +200,9 @@ class Dependency:
 
         """
         # Create Prerequisite.
-        cpre = Prerequisite(point, tdef.start_point)
+        start_point = tdef.start_point
+        cpre = Prerequisite(point, start_point)
+        add = cpre.add
 
         # Loop over TaskTrigger instances.
         for task_trigger in self.task_triggers:
@@ -218,22 +222,29 @@ class Dependency:
                              tdef.max_future_prereq_offset)):
                         tdef.max_future_prereq_offset = (
                             prereq_offset)
-                cpre.add(
+                if (
+                    task_trigger.offset_is_absolute
+                    or task_trigger.offset_is_from_icp
+                ):
+                    trigger_point = task_trigger.get_point(point)
+                else:
+                    # Same as task_trigger.get_point(point).
+                    trigger_point = prereq_offset_point
+                add(
                     task_trigger.task_name,
-                    task_trigger.get_point(point),
+                    trigger_point,
                     task_trigger.output,
                     (
-                        (prereq_offset_point < tdef.start_point) &
-                        (point >= tdef.start_point)
+                        (prereq_offset_point < start_point) &
+                        (point >= start_point)
                     )
                 )
             else:
                 # Trigger is within the same cycle point.
                 # Register task message with Prerequisite object.
-                cpre.add(task_trigger.task_name,
-                         task_trigger.get_point(point),
-                         task_trigger.output)
-        cpre.set_condition(self.get_expression(point))
+                add(task_trigger.task_name, point, task_trigger.output)
+        if self._is_conditional:
+            cpre.set_condition(self.get_expression(point))
         return cpre
 
     def get_expression(self, point):
@@ -261,6 +272,17 @@ class Dependency:
                 ret.append('( %s )' % str(item))
         return ' '.join(ret)
 
+    @classmethod
+    def _contains_or(cls, nested_expr):
+        """Return True if a nested expression contains the '|' operator."""
+        for item in nested_expr:
+            if isinstance(item, list):
+                if cls._contains_or(item):
+                    return True
+            elif isinstance(item, str) and '|' in item:
+                return True
+        return False
+
     @classmethod
     def _stringify_list(cls, nested_expr, point):
         """Stringify a nested list of TaskTrigger objects."""
@@ -270,7 +292,9 @@ class Dependency:
                 ret.append(Prerequisite.MESSAGE_TEMPLATE % (
                     item.task_name, item.get_point(point), item.output))
             elif isinstance(item, list):
-                ret.extend(['('] + cls._stringify_list(item, point) + [')'])
+                ret.append('(')
+                ret.extend(cls._stringify_list(item, point))
+                ret.append(')')
             else:
                 ret.append(item)
         return ret
@@ -17,8 +17,10 @@
 """Task definition."""
 
 from collections import deque
+from types import MappingProxyType
 
 import cylc.flow.flags
+from cylc.flow.cycling.iso8601 import interval_parse
 from cylc.flow.exceptions import TaskDefError
 from cylc.flow.task_id import TaskID
 from cylc.flow.task_state import (
@@ -55,17 +57,15 @@ def generate_graph_children(tdef, point):
 
     if tdef.sequential:
         # Add next-instance child.
-        nexts = []
+        next_point = None
         for seq in tdef.sequences:
             nxt = seq.get_next_point(point)
-            if nxt is not None:
+            if nxt is not None and (next_point is None or nxt < next_point):
                 # Within sequence bounds.
-                nexts.append(nxt)
-        if nexts:
-            if TASK_OUTPUT_SUCCEEDED not in graph_children:
-                graph_children[TASK_OUTPUT_SUCCEEDED] = []
-            graph_children[TASK_OUTPUT_SUCCEEDED].append(
-                (tdef.name, min(nexts), False))
+                next_point = nxt
+        if next_point is not None:
+            graph_children.setdefault(TASK_OUTPUT_SUCCEEDED, []).append(
+                (tdef.name, next_point, False))
 
     return graph_children
 
@@ -90,16 +90,15 @@ def generate_graph_parents(tdef, point):
 
     if tdef.sequential:
         # Add prev-instance parent.
-        prevs = []
+        prev_point = None
         for seq in tdef.sequences:
             prev = seq.get_prev_point(point)
-            if prev is not None:
+            if prev is not None and (prev_point is None or prev < prev_point):
                 # Within sequence bounds.
-                prevs.append(prev)
-        if prevs:
-            if seq not in graph_parents:
-                graph_parents[seq] = []
-            graph_parents[seq].append((tdef.name, min(prevs), False))
+                prev_point = prev
+        if prev_point is not None:
+            graph_parents.setdefault(seq, []).append(
+                (tdef.name, prev_point, False))
 
     return graph_parents
 
@@ -113,12 +112,17 @@ class TaskDef:
         "used_in_offset_trigger", "max_future_prereq_offset",
         "sequential", "is_coldstart",
         "workflow_polling_cfg", "clocktrigger_offset", "expiration_offset",
-        "namespace_hierarchy", "dependencies", "outputs", "param_var",
+        "_namespace_hierarchy", "namespace_hierarchy_set",
+        "dependencies", "outputs", "param_var",
         "graph_children", "graph_parents",
-        "external_triggers", "xtrig_labels", "name", "elapsed_times"]
+        "external_triggers", "xtrig_labels", "name", "elapsed_times",
+        "_clocktrigger_offset_seconds", "_expiration_offset_seconds",
+        "late_offset_seconds", "_triggers", "_graph_children_cache"]
 
     # Store the elapsed times for a maximum of 10 cycles
     MAX_LEN_ELAPSED_TIMES = 10
+    # Store the graph children for a maximum of 100 cycles
+    MAX_LEN_GRAPH_CHILDREN_CACHE = 100
     ERR_PREFIX_TASK_NOT_ON_SEQUENCE = "Invalid cycle point for task: "
 
     def __init__(self, name, rtcfg, run_mode, start_point, initial_point):
@@ -140,10 +144,16 @@ class TaskDef:
 
         self.clocktrigger_offset = None
         self.expiration_offset = None
-        self.namespace_hierarchy = []
+        self._clocktrigger_offset_seconds = None
+        self._expiration_offset_seconds = None
+        self.late_offset_seconds = None
+        self.namespace_hierarchy = ()
         self.dependencies = {}
+        # {sequence: (parent triggers, absolute triggers)}
+        self._triggers = None
         self.outputs = {}  # {output: (message, is_required)}
         self.graph_children = {}
+        self._graph_children_cache = {}  # {point: graph children}
         self.graph_parents = {}
         self.param_var = {}
         self.external_triggers = []
@@ -153,6 +163,52 @@ class TaskDef:
         self.elapsed_times = deque(maxlen=self.MAX_LEN_ELAPSED_TIMES)
         self._add_std_outputs()
 
+    @property
+    def namespace_hierarchy(self):
+        """Return the (tuple) namespace hierarchy of this task."""
+        return self._namespace_hierarchy
+
+    @namespace_hierarchy.setter
+    def namespace_hierarchy(self, hierarchy):
+        """Set the namespace hierarchy, and a frozenset for fast lookups."""
+        self._namespace_hierarchy = tuple(hierarchy)
+        self.namespace_hierarchy_set = frozenset(self._namespace_hierarchy)
+
+    @staticmethod
+    def get_offset_as_seconds(offset):
+        """Return an ISO interval as seconds."""
+        return int(interval_parse(str(offset)).get_seconds())
+
+    @property
+    def clocktrigger_offset_seconds(self):
+        """Return the clock trigger offset as seconds, or None if unset.
+
+        Parsed once (on first access) and cached - the offset is the same
+        for every instance of this task.
+        """
+        if (
+            self._clocktrigger_offset_seconds is None
+            and self.clocktrigger_offset is not None
+        ):
+            self._clocktrigger_offset_seconds = self.get_offset_as_seconds(
+                self.clocktrigger_offset)
+        return self._clocktrigger_offset_seconds
+
+    @property
+    def expiration_offset_seconds(self):
+        """Return the expiration offset as seconds, or None if unset.
+
+        Parsed once (on first access) and cached - the offset is the same
+        for every instance of this task.
+        """
+        if (
+            self._expiration_offset_seconds is None
+            and self.expiration_offset is not None
+        ):
+            self._expiration_offset_seconds = self.get_offset_as_seconds(
+                self.expiration_offset)
+        return self._expiration_offset_seconds
+
     def add_output(self, output, message):
         """Add a new task output as defined under [runtime]."""
         # optional/required is None until defined by the graph
@@ -203,6 +259,26 @@ class TaskDef:
         self.graph_children.setdefault(
             sequence, {}).setdefault(
                 trigger.output, []).append((taskname, trigger))
+        self._graph_children_cache.clear()
+
+    def get_graph_children(self, point):
+        """Return a shared, read-only copy of my graph children at point.
+
+        Graph children depend only on the task definition and cycle point, so
+        task proxies for the same task and point can share them.
+        """
+        try:
+            return self._graph_children_cache[point]
+        except KeyError:
+            pass
+        graph_children = MappingProxyType(
+            generate_graph_children(self, point))
+        cache = self._graph_children_cache
+        if len(cache) >= self.MAX_LEN_GRAPH_CHILDREN_CACHE:
+            # Drop the oldest entry.
+            del cache[next(iter(cache))]
+        cache[point] = graph_children
+        return graph_children
 
     # graph_parents not currently used, but might be soon:
     def add_graph_parent(self, trigger, parent, sequence):
@@ -226,6 +302,7 @@ class TaskDef:
 
         """
         self.dependencies.setdefault(sequence, []).append(dependency)
+        self._triggers = None
 
     def add_xtrig_label(self, xtrig_label, sequence):
         """Add an xtrigger to a named sequence.
@@ -242,6 +319,7 @@ class TaskDef:
         """Add a sequence."""
         if sequence not in self.sequences:
             self.sequences.append(sequence)
+            self._graph_children_cache.clear()
 
     def describe(self):
         """Return title and description of the current task."""
@@ -256,33 +334,49 @@ class TaskDef:
             raise TaskDefError(
                 "No cycling sequences defined for %s" % self.name)
 
+    def _get_triggers(self, point):
+        """Yield (parent triggers, absolute triggers) of sequences at point.
+
+        Only sequences valid at point are included.
+        """
+        if self._triggers is None:
+            # Triggers by sequence don't depend on the point, so work them
+            # out once (dependencies are all added by now).
+            self._triggers = {
+                seq: (
+                    tuple(
+                        trig
+                        for dep in deps
+                        if not dep.suicide
+                        for trig in dep.task_triggers
+                    ),
+                    {
+                        trig
+                        for dep in deps
+                        for trig in dep.task_triggers
+                        if trig.offset_is_absolute or trig.offset_is_from_icp
+                    }
+                )
+                for seq, deps in self.dependencies.items()
+            }
+        for seq in self.sequences:
+            # (task has prereqs in this sequence)
+            if seq in self._triggers and seq.is_valid(point):
+                yield self._triggers[seq]
+
     def get_parent_points(self, point):
         """Return the cycle points of my parents, at point."""
-        parent_points = set()
-        for seq in self.sequences:
-            if not seq.is_valid(point):
-                continue
-            if seq in self.dependencies:
-                # task has prereqs in this sequence
-                for dep in self.dependencies[seq]:
-                    if dep.suicide:
-                        continue
-                    for trig in dep.task_triggers:
-                        parent_points.add(trig.get_parent_point(point))
-        return parent_points
+        return {
+            trig.get_parent_point(point)
+            for parent_triggers, _ in self._get_triggers(point)
+            for trig in parent_triggers
+        }
 
     def get_abs_triggers(self, point):
         """Return my absolute triggers, if any, at point."""
         abs_triggers = set()
-        for seq in self.sequences:
-            if not seq.is_valid(point):
-                continue
-            if seq in self.dependencies:
-                # task has prereqs in this sequence
-                for dep in self.dependencies[seq]:
-                    for trig in dep.task_triggers:
-                        if trig.offset_is_absolute or trig.offset_is_from_icp:
-                            abs_triggers.add(trig)
+        for _, seq_abs_triggers in self._get_triggers(point):
+            abs_triggers.update(seq_abs_triggers)
         return abs_triggers
 
     def is_valid_point(self, point):
@@ -19,7 +19,8 @@
 import pytest
 from unittest.mock import Mock
 from collections import Counter
-from cylc.flow.task_queues.independent import IndepQueueManager
+from cylc.flow.task_queues.independent import (
+    IndepQueueManager, LimitedTaskQueue)
 from cylc.flow.task_state import TASK_STATUS_PREPARING
 
 
@@ -103,3 +104,17 @@ def test_queue_and_release(
     # check second assignment overrides first
     for group in expected_foo_groups:
         assert "foo" in queue_mgr.queues[group].members
+
+
+def test_release_unlimited():
+    """Test an unlimited queue releases all tasks in queue order."""
+    queue = LimitedTaskQueue(0, set(MEMBERS))
+    for name in ["a", "b", "c"]:
+        itask = Mock()
+        itask.tdef.name = name
+        queue.push_task(itask)
+    active = Counter(ACTIVE)
+    released = queue.release(active)
+    assert [r.tdef.name for r in released] == ["a", "b", "c"]
+    assert not queue.deque
+    assert active == Counter(["a", "a", "a", "b", "c", "d"])
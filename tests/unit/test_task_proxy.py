@@ -41,7 +41,8 @@ def test_point_match(
 ) -> None:
     """Test TaskProxy.point_match()."""
     set_cycling_type(itask_point.TYPE)
-    mock_itask = Mock(point=itask_point.standardise())
+    point = itask_point.standardise()
+    mock_itask = Mock(point=point, _point_str=str(point))
 
     assert TaskProxy.point_match(mock_itask, point_str) is expected
 
@@ -53,6 +54,8 @@ def test_point_match(
      ('root', True),
      ('horse', False),
      ('F*', True),
+     ('FA', False),
+     ('FA?', True),
      ('*', True)]
 )
 def test_name_match(name_str: str, expected: bool):
@@ -60,7 +63,11 @@ def test_name_match(name_str: str, expected: bool):
 
     For a task named "beer" in family "FAM".
     """
-    mock_tdef = Mock(namespace_hierarchy=['root', 'FAM', 'beer'])
+    namespace_hierarchy = ('root', 'FAM', 'beer')
+    mock_tdef = Mock(
+        namespace_hierarchy=namespace_hierarchy,
+        namespace_hierarchy_set=frozenset(namespace_hierarchy)
+    )
     mock_tdef.name = 'beer'
     mock_itask = Mock(tdef=mock_tdef)
 
@@ -81,3 +88,135 @@ def test_status_match(status_str: Optional[str], expected: bool):
     mock_itask = Mock(state=Mock(status='waiting'))
 
     assert TaskProxy.status_match(mock_itask, status_str) is expected
+
+
+def test_non_unique_events():
+    """Test non-unique event counts are allocated on first use."""
+    mock_itask = Mock(non_unique_events=None)
+    assert TaskProxy.get_non_unique_event_count(mock_itask, 'warning') == 0
+    TaskProxy.bump_non_unique_event(mock_itask, 'warning')
+    TaskProxy.bump_non_unique_event(mock_itask, 'warning')
+    assert TaskProxy.get_non_unique_event_count(mock_itask, 'warning') == 2
+    assert TaskProxy.get_non_unique_event_count(mock_itask, 'critical') == 0
+
+
+def test_append_job():
+    """Test the job list is allocated on the first job."""
+    mock_itask = Mock(jobs=None)
+    TaskProxy.append_job(mock_itask, 'job1')
+    assert mock_itask.jobs == ['job1']
+    jobs = mock_itask.jobs
+    TaskProxy.append_job(mock_itask, 'job2')
+    assert mock_itask.jobs is jobs
+    assert jobs == ['job1', 'job2']
+
+
+def test_summary():
+    """Test the summary is created on first access and shared on reload."""
+    def bare_proxy():
+        itask = TaskProxy.__new__(TaskProxy)
+        itask._summary = None
+        itask.submit_num = 1
+        itask.is_manual_submit = False
+        itask.local_job_file_path = None
+        itask.try_timers = {}
+        itask.platform = {}
+        itask.job_vacated = False
+        itask.poll_timer = None
+        itask.timeout = None
+        itask.state = Mock()
+        return itask
+
+    pred = bare_proxy()
+    assert pred._summary is None
+    summary = pred.summary
+    assert summary['submitted_time'] is None
+    assert pred.summary is summary
+
+    # a summary never accessed before reload is still shared
+    pred = bare_proxy()
+    succ = bare_proxy()
+    pred.copy_to_reload_successor(succ)
+    assert pred.reload_successor is succ
+    pred.summary['submit_method_id'] = '123'
+    assert succ.summary is pred.summary
+    assert succ.summary['submit_method_id'] == '123'
+
+
+def test_filter_proxies(set_cycling_type: Callable):
+    """Test TaskProxy.filter_proxies() matches on point and status."""
+    set_cycling_type(IntegerPoint.TYPE)
+    itasks = [
+        Mock(
+            _point_str=str(point),
+            state=Mock(status=status),
+            name_match=Mock(return_value=True)
+        )
+        for point, status in [(1, 'waiting'), (2, 'running'), (12, 'waiting')]
+    ]
+    assert TaskProxy.filter_proxies(itasks, 'foo') == itasks
+    assert TaskProxy.filter_proxies(itasks, 'foo', '1') == itasks[:1]
+    assert TaskProxy.filter_proxies(itasks, 'foo', '1*') == [
+        itasks[0], itasks[2]]
+    assert TaskProxy.filter_proxies(
+        itasks, 'foo', '1*', 'waiting') == [itasks[0], itasks[2]]
+    assert TaskProxy.filter_proxies(itasks, 'foo', None, 'running') == [
+        itasks[1]]
+
+
+def test_is_waiting_clock_done():
+    """Test the clock trigger is not re-checked once it has passed."""
+    mock_itask = Mock(
+        tdef=Mock(clocktrigger_offset='PT1H', clocktrigger_offset_seconds=0),
+        clock_trigger_time=None,
+        is_clock_trigger_done=False,
+        get_point_as_seconds=Mock(return_value=0)
+    )
+    assert TaskProxy.is_waiting_clock_done(mock_itask)
+    assert mock_itask.is_clock_trigger_done
+    mock_itask.clock_trigger_time = float('inf')
+    assert TaskProxy.is_waiting_clock_done(mock_itask)
+
+
+def test_set_summary_time():
+    """Test TaskProxy.set_summary_time() with and without an epoch time."""
+    mock_itask = Mock(summary={})
+    TaskProxy.set_summary_time(mock_itask, 'started', '1970-01-01T00:01:00Z')
+    assert mock_itask.summary == {
+        'started_time': 60.0,
+        'started_time_string': '1970-01-01T00:01:00Z'
+    }
+    TaskProxy.set_summary_time(
+        mock_itask, 'finished', '1970-01-01T00:02:00Z', epoch=120)
+    assert mock_itask.summary['finished_time'] == 120.0
+    TaskProxy.set_summary_time(mock_itask, 'started')
+    assert mock_itask.summary['started_time'] is None
+    assert mock_itask.summary['started_time_string'] is None
+
+
+@pytest.mark.parametrize(
+    'is_manual_submit, is_held, waiting, clock_done, expected',
+    [
+        param(True, True, False, False, (True,), id="manual submit"),
+        param(False, True, True, True, (False,), id="held"),
+        param(False, False, True, True, (True, True, True), id="ready"),
+        param(False, False, True, False, (True, False, True), id="clock"),
+    ]
+)
+def test_is_ready(
+    is_manual_submit: bool,
+    is_held: bool,
+    waiting: bool,
+    clock_done: bool,
+    expected: tuple
+):
+    """Test is_ready() agrees with is_ready_to_run()."""
+    mock_itask = Mock(
+        is_manual_submit=is_manual_submit,
+        try_timers={},
+        state=Mock(is_held=is_held, return_value=waiting, status='waiting'),
+        is_waiting_clock_done=Mock(return_value=clock_done),
+        is_waiting_prereqs_done=Mock(return_value=True),
+    )
+    assert TaskProxy.is_ready_to_run(mock_itask) == expected
+    assert TaskProxy.is_ready(mock_itask) is all(expected)
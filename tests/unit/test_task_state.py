@@ -16,12 +16,18 @@
 
 import pytest
 
+from cylc.flow.prerequisite import Prerequisite
 from cylc.flow.taskdef import TaskDef
 from cylc.flow.task_state import (
     TaskState,
+    status_geq,
+    status_leq,
+    TASK_OUTPUT_FAILED,
+    TASK_OUTPUT_SUCCEEDED,
     TASK_STATUS_SUCCEEDED,
     TASK_STATUS_FAILED,
     TASK_STATUS_WAITING,
+    TASK_STATUS_RUNNING,
 )
 
 
@@ -127,3 +133,53 @@ def test_reset_outputs(before, after, outputs):
     assert tstate.outputs.get_completed() == []
     tstate.reset(status=new_status, is_held=new_is_held)
     assert tstate.outputs.get_completed() == outputs
+
+
+def test_invalidate_prerequisites_cache():
+    """Test the cached prerequisite state is recomputed on invalidation."""
+    tdef = TaskDef('foo', {}, 'live', '123', '123')
+    tstate = TaskState(tdef, '123', TASK_STATUS_WAITING, False)
+    assert tstate.prerequisites_all_satisfied()
+
+    prereq = Prerequisite('123')
+    prereq.add('bar', '123', TASK_OUTPUT_SUCCEEDED)
+    tstate.prerequisites.append(prereq)
+    assert tstate.prerequisites_all_satisfied()  # cached
+
+    tstate.invalidate_prerequisites_cache()
+    assert not tstate.prerequisites_all_satisfied()
+
+
+def test_satisfy_me_cache():
+    """Test satisfy_me only clears the cache of the list it changes."""
+    tdef = TaskDef('foo', {}, 'live', '123', '123')
+    tstate = TaskState(tdef, '123', TASK_STATUS_WAITING, False)
+    prereq = Prerequisite('123')
+    prereq.add('bar', '123', TASK_OUTPUT_SUCCEEDED)
+    tstate.prerequisites.append(prereq)
+    suicide_prereq = Prerequisite('123')
+    suicide_prereq.add('baz', '123', TASK_OUTPUT_FAILED)
+    tstate.suicide_prerequisites.append(suicide_prereq)
+    assert not tstate.prerequisites_all_satisfied()
+    assert not tstate.suicide_prerequisites_all_satisfied()
+
+    tstate.satisfy_me({('bar', '123', TASK_OUTPUT_SUCCEEDED)})
+    assert tstate.prerequisites_all_satisfied()
+    assert not tstate.suicide_prerequisites_all_satisfied()
+
+    tstate.satisfy_me({('baz', '123', TASK_OUTPUT_FAILED)})
+    assert tstate.prerequisites_all_satisfied()
+    assert tstate.suicide_prerequisites_all_satisfied()
+
+
+def test_status_ordering():
+    """Test status comparisons follow TASK_STATUSES_ORDERED."""
+    assert status_leq(TASK_STATUS_WAITING, TASK_STATUS_RUNNING)
+    assert status_leq(TASK_STATUS_RUNNING, TASK_STATUS_RUNNING)
+    assert not status_leq(TASK_STATUS_SUCCEEDED, TASK_STATUS_RUNNING)
+    assert status_geq(TASK_STATUS_SUCCEEDED, TASK_STATUS_FAILED)
+    assert not status_geq(TASK_STATUS_WAITING, TASK_STATUS_RUNNING)
+    tdef = TaskDef('foo', {}, 'live', '123', '123')
+    tstate = TaskState(tdef, '123', TASK_STATUS_RUNNING, False)
+    assert tstate.is_gt(TASK_STATUS_WAITING)
+    assert not tstate.is_gt(TASK_STATUS_RUNNING)
@@ -84,6 +84,19 @@ def test_check_for_list_of_lists_exp():
     assert actual == expected
 
 
+def test_dependency_is_conditional():
+    task_trigger = TaskTrigger(
+        'fake_task_name', None, 'fakeOutput', None, None, None, None)
+    assert not Dependency(
+        [task_trigger, '&', task_trigger], [task_trigger], False
+    )._is_conditional
+    assert Dependency(
+        [task_trigger, '&', [task_trigger, '|', task_trigger]],
+        [task_trigger],
+        False
+    )._is_conditional
+
+
 def test_check_trigger_name():
     assert not TaskOutputs.is_valid_std_name("Elephant")
 
@@ -0,0 +1,104 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Callable
+from unittest.mock import Mock, patch
+
+from cylc.flow.cycling.iso8601 import ISO8601Interval, interval_parse
+from cylc.flow.taskdef import TaskDef, generate_graph_children
+
+
+def test_clocktrigger_offset_seconds(set_cycling_type: Callable):
+    """Test the clock trigger offset is parsed once and cached."""
+    set_cycling_type('iso8601')
+    tdef = TaskDef('foo', {}, 'live', None, None)
+    assert tdef.clocktrigger_offset_seconds is None
+    tdef.clocktrigger_offset = ISO8601Interval('PT1H')
+    with patch(
+        'cylc.flow.taskdef.interval_parse', wraps=interval_parse
+    ) as mock_parse:
+        assert tdef.clocktrigger_offset_seconds == 3600
+        assert tdef.clocktrigger_offset_seconds == 3600
+    assert mock_parse.call_count == 1
+
+
+def test_expiration_offset_seconds(set_cycling_type: Callable):
+    """Test the expiration offset is parsed as seconds."""
+    set_cycling_type('iso8601')
+    tdef = TaskDef('foo', {}, 'live', None, None)
+    assert tdef.expiration_offset_seconds is None
+    tdef.expiration_offset = ISO8601Interval('PT30M')
+    assert tdef.expiration_offset_seconds == 1800
+
+
+def test_get_graph_children(set_cycling_type: Callable):
+    """Test graph children are cached per point on the TaskDef."""
+    set_cycling_type('integer')
+    tdef = TaskDef('foo', {}, 'live', None, None)
+    with patch.object(TaskDef, 'MAX_LEN_GRAPH_CHILDREN_CACHE', 2), patch(
+        'cylc.flow.taskdef.generate_graph_children',
+        wraps=generate_graph_children
+    ) as mock_generate:
+        assert tdef.get_graph_children(1) is tdef.get_graph_children(1)
+        assert mock_generate.call_count == 1
+        tdef.get_graph_children(2)
+        tdef.get_graph_children(3)
+        # the oldest point has been dropped from the cache
+        assert list(tdef._graph_children_cache) == [2, 3]
+        tdef.get_graph_children(1)
+        assert mock_generate.call_count == 4
+
+
+def test_get_parent_points_and_abs_triggers():
+    """Test the triggers cached per sequence on the TaskDef."""
+    def trigger(parent_point, is_abs=False):
+        return Mock(
+            offset_is_absolute=is_abs,
+            offset_is_from_icp=False,
+            get_parent_point=Mock(return_value=parent_point)
+        )
+
+    tdef = TaskDef('foo', {}, 'live', None, None)
+    valid_seq = Mock(is_valid=Mock(return_value=True))
+    invalid_seq = Mock(is_valid=Mock(return_value=False))
+    tdef.add_sequence(valid_seq)
+    tdef.add_sequence(invalid_seq)
+
+    rel_trig = trigger('1')
+    abs_trig = trigger('2', is_abs=True)
+    suicide_trig = trigger('3', is_abs=True)
+    tdef.add_dependency(
+        Mock(suicide=False, task_triggers=[rel_trig]), valid_seq)
+    tdef.add_dependency(
+        Mock(suicide=False, task_triggers=[abs_trig]), valid_seq)
+    tdef.add_dependency(
+        Mock(suicide=True, task_triggers=[suicide_trig]), valid_seq)
+    tdef.add_dependency(
+        Mock(suicide=False, task_triggers=[trigger('4', is_abs=True)]),
+        invalid_seq
+    )
+
+    # suicide triggers are not parents, but can be absolute triggers;
+    # sequences not valid at the point are skipped
+    assert tdef.get_parent_points('5') == {'1', '2'}
+    assert tdef.get_abs_triggers('5') == {abs_trig, suicide_trig}
+
+    # adding a dependency invalidates the cache
+    assert tdef._triggers is not None
+    tdef.add_dependency(
+        Mock(suicide=False, task_triggers=[trigger('6')]), valid_seq)
+    assert tdef._triggers is None
+    assert tdef.get_parent_points('5') == {'1', '2', '6'}